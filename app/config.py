@@ -1,7 +1,8 @@
 """
 Configuration management for the application.
 """
-from typing import Optional, Set
+from functools import cached_property
+from typing import FrozenSet, Optional
 from pydantic_settings import BaseSettings
 
 
@@ -32,16 +33,16 @@ class Settings(BaseSettings):
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
     ALLOWED_EXTENSIONS: str = ".pdf"  # Comma-separated or single value (e.g., ".pdf" or ".pdf,.doc,.docx")
     
-    @property
-    def allowed_extensions_set(self) -> Set[str]:
-        """Get allowed extensions as a set."""
+    @cached_property
+    def allowed_extensions_set(self) -> FrozenSet[str]:
+        """Get allowed extensions as a frozenset (computed once, settings are immutable after load)."""
         if isinstance(self.ALLOWED_EXTENSIONS, str):
             # Handle comma-separated values or single value
             extensions = [ext.strip() for ext in self.ALLOWED_EXTENSIONS.split(',') if ext.strip()]
-            return set(extensions)
+            return frozenset(extensions)
         elif isinstance(self.ALLOWED_EXTENSIONS, (list, set)):
-            return set(self.ALLOWED_EXTENSIONS)
-        return {".pdf"}  # Default fallback
+            return frozenset(self.ALLOWED_EXTENSIONS)
+        return frozenset({".pdf"})  # Default fallback
     
     class Config:
         env_file = ".env"
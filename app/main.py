@@ -3,8 +3,10 @@ Main FastAPI application entry point.
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.config import settings
 from app.routes import cv
+from app.services.pdf_extractor import shutdown_pool
 import logging
 
 # Configure logging
@@ -21,7 +23,8 @@ app = FastAPI(
     version=settings.API_VERSION,
     description=settings.API_DESCRIPTION,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -55,3 +58,9 @@ async def startup_event():
     logger.info(f"AI Provider: {settings.AI_PROVIDER}")
     logger.info(f"Server running on http://{settings.HOST}:{settings.PORT}")
 
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release AI provider clients and PDF extraction worker pools."""
+    await cv.close_ai_service()
+    shutdown_pool()
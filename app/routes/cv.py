@@ -2,32 +2,41 @@
 CV processing routes.
 """
 from fastapi import APIRouter, UploadFile, File, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from app.models.response import CVSummaryResponse, ErrorResponse
 from app.services.pdf_extractor import PDFExtractor
 from app.services.ai_service import AIService
 from app.config import settings
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1", tags=["CV"])
 
+# Size of each read when streaming an upload
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
 # Initialize services
 pdf_extractor = PDFExtractor()
 
-# Lazy initialization of AI service to handle missing API keys gracefully
-_ai_service = None
-
+# Lazy initialization of AI service to handle missing API keys gracefully.
+# functools.cache keeps the single instance; failed constructions are not cached.
+@functools.cache
 def get_ai_service():
     """Get or create AI service instance."""
-    global _ai_service
-    if _ai_service is None:
-        try:
-            _ai_service = AIService()
-        except ValueError as e:
-            logger.error(f"AI service initialization failed: {str(e)}")
-            raise ValueError(f"AI service not configured: {str(e)}")
-    return _ai_service
+    try:
+        return AIService()
+    except ValueError as e:
+        logger.error(f"AI service initialization failed: {str(e)}")
+        raise ValueError(f"AI service not configured: {str(e)}")
+
+
+async def close_ai_service():
+    """Close the AI service instance if it was created."""
+    if get_ai_service.cache_info().currsize:
+        await get_ai_service().aclose()
+        get_ai_service.cache_clear()
 
 
 @router.post(
@@ -59,7 +68,8 @@ async def process_cv(file: UploadFile = File(...)):
                 detail="No file provided"
             )
         
-        file_ext = "." + file.filename.split(".")[-1].lower() if "." in file.filename else ""
+        _, sep, ext = file.filename.rpartition(".")
+        file_ext = "." + ext.lower() if sep else ""
         allowed_extensions = settings.allowed_extensions_set
         if file_ext not in allowed_extensions:
             raise HTTPException(
@@ -67,20 +77,24 @@ async def process_cv(file: UploadFile = File(...)):
                 detail=f"Invalid file type. Allowed types: {', '.join(allowed_extensions)}"
             )
         
-        # Read file content
-        content = await file.read()
-        
-        # Validate file size
-        if len(content) > settings.MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"File too large. Maximum size: {settings.MAX_FILE_SIZE / (1024*1024):.1f}MB"
-            )
+        # Read file content in chunks, validating size as we go so oversized
+        # uploads are rejected without buffering them entirely in memory
+        buffer = bytearray()
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            if len(buffer) + len(chunk) > settings.MAX_FILE_SIZE:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"File too large. Maximum size: {settings.MAX_FILE_SIZE / (1024*1024):.1f}MB"
+                )
+            buffer.extend(chunk)
+        content = bytes(buffer)
         
         # Extract text from PDF
         try:
-            cv_text = pdf_extractor.extract_text(content)
-            if not cv_text or len(cv_text.strip()) < 50:
+            # PDF decoding is CPU-bound; run it off the event loop
+            cv_text = await run_in_threadpool(pdf_extractor.extract_text, content)
+            # extract_text returns already-stripped text, so no need to copy it via strip()
+            if not cv_text or len(cv_text) < 50:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Could not extract sufficient text from PDF. Please ensure the PDF contains readable text."
@@ -1,20 +1,314 @@
 """
 PDF text extraction service with multiple extraction methods for better compatibility.
 """
+import hashlib
+import importlib.util
 import io
+import os
 import re
 import logging
-import PyPDF2
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack
+from typing import Callable, List, Optional, Sequence, Tuple
+import numpy as np
 import pdfplumber
 
+# pypdfium2 (native PDFium) is preferred over pure-Python PyPDF2. PyPDF2 is only
+# used, and only imported, when pypdfium2 is not installed.
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on worker processes used for per-page extraction
+MAX_PAGE_WORKERS = 4
+
+# Minimum first-page text length for a PDF to be treated as plain text
+FAST_PATH_MIN_CHARS = 200
+
+# Tabs or wide runs of spaces suggest column/table layout
+_TABLE_HINT_RE = re.compile(r'\t| {3,}')
+# A text run with digits but no letters, e.g. "2019 - 2021" or "8" (a table cell)
+_NUMERIC_CELL_RE = re.compile(r'[^A-Za-z]*\d[^A-Za-z]*')
+
+# Empty vertical band (in points) between text runs that marks separate columns
+PROBE_MIN_COLUMN_GAP = 20
+# Text runs needed on each side of a gap, or in one aligned stack of numbers
+PROBE_MIN_COLUMN_RUNS = 3
+
+# Patterns used by PDFExtractor._normalize_text
+_DIGIT_SPACE_DIGIT_RE = re.compile(r'\d\s+\d')
+# Short digit groups separated by whitespace: "201 9", "20 1 5", "06/202 3"
+_SPLIT_DIGITS_RE = re.compile(r'\b\d{1,3}(?:\s+\d{1,3}){1,3}\b')
+_MULTI_SPACE_RE = re.compile(r' +')
+_MULTI_NEWLINE_RE = re.compile(r'\n{3,}')
+# Split month names: "Jan uary" -> "January", "Feb ruary" -> "February", etc.
+_MONTH_SPLIT_RE = re.compile(
+    r'Jan\s+uary|Feb\s+ruary|Mar\s+ch|Apr\s+il|May\s+|Jun\s+e|Jul\s+y|'
+    r'Aug\s+ust|Sep\s+tember|Oct\s+ober|Nov\s+ember|Dec\s+ember',
+    re.IGNORECASE
+)
+_MONTH_NAMES = {
+    'jan': 'January', 'feb': 'February', 'mar': 'March', 'apr': 'April',
+    'may': 'May', 'jun': 'June', 'jul': 'July', 'aug': 'August',
+    'sep': 'September', 'oct': 'October', 'nov': 'November', 'dec': 'December',
+}
+# Letters OCR commonly confuses with digits, when they sit between two digits
+_OCR_DIGIT_FIX_RE = re.compile(r'(?<=\d)[OlI](?=\d)')
+_OCR_DIGIT_TABLE = str.maketrans({'O': '0', 'l': '1', 'I': '1'})
+_DATE_SEP_RE = re.compile(r'(\d{1,2})[/\-\.](\d{1,2})[/\-\.](\d{2,4})')
+_PRESENT_RE = re.compile(r'\b(?:present|current|now|till\s+date)\b', re.IGNORECASE)
+_TWO_DIGIT_YEAR_RE = re.compile(r'(\d{1,2}/)(\d{2})(?!\d)')
+
+
+def _collapse_split_digits(match: re.Match) -> str:
+    """Join digit groups split by whitespace ("201 9" -> "2019") if the result looks like a year."""
+    parts = match.group(0).split()
+    joined = ''.join(parts)
+    # Only year-like results are joined: 4 digits containing a 2+ digit group
+    # ("2 019", "20 1 9"), or 3 digits that start with one ("20 1"). Either may
+    # also follow a "/" ("06/2 0 1"). Runs of single digits such as "Room 1 2 3"
+    # or "1 2 3 4" are left alone.
+    after_slash = match.string[match.start() - 1:match.start()] == '/'
+    if len(joined) == 4 and (after_slash or max(map(len, parts)) >= 2):
+        return joined
+    if len(joined) == 3 and (after_slash or len(parts[0]) >= 2):
+        return joined
+    return match.group(0)
+
+
+def _fix_month(match: re.Match) -> str:
+    """Replace a split month name with its full name."""
+    return _MONTH_NAMES[match.group(0)[:3].lower()]
+
+
+def _fix_ocr_digit(match: re.Match) -> str:
+    """Replace a letter misread by OCR with the digit it stands for."""
+    return match.group(0).translate(_OCR_DIGIT_TABLE)
+
+
+def _expand_two_digit_year(match: re.Match) -> str:
+    """Expand a 2-digit year after a slash to 4 digits ("04/23" -> "04/2023")."""
+    year = match.group(2)
+    return match.group(1) + ('20' + year if int(year) < 50 else '19' + year)
+
+
+# Render zoom for OCR (1.0 = 72 DPI). 2x was the previous fixed zoom and stays the
+# default; only full-page scans with more detail than that are rendered larger.
+OCR_ZOOM = 2.0
+OCR_MAX_ZOOM = 2.5
+
+# Fraction of the page area an image must cover to count as a full-page scan
+OCR_SCAN_MIN_COVERAGE = 0.8
+
+# Pages rendered and OCR'd per batch, per OCR thread (bounds pixmap memory)
+OCR_BATCH_PAGES_PER_WORKER = 2
+
+# Maximum number of extraction results kept in the LRU cache
+EXTRACTION_CACHE_SIZE = 128
+
+# LRU cache of normalized text keyed by a hash of the PDF bytes. extract_text runs
+# in worker threads, so access is guarded by a lock.
+_extraction_cache: "OrderedDict[bytes, str]" = OrderedDict()
+_extraction_cache_lock = threading.Lock()
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+_ocr_pool: Optional[ThreadPoolExecutor] = None
+_ocr_pool_lock = threading.Lock()
+
+
+def _page_worker_count() -> int:
+    """Number of worker processes used for per-page extraction."""
+    return min(os.cpu_count() or 1, MAX_PAGE_WORKERS)
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Get or create the shared process pool for per-page extraction."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            # The pool is created from a worker thread of a multi-threaded server, so
+            # use "spawn" rather than fork to avoid inheriting held locks
+            _process_pool = ProcessPoolExecutor(
+                max_workers=_page_worker_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _process_pool
+
+
+def _discard_process_pool(pool: ProcessPoolExecutor):
+    """Drop a broken pool so the next call creates a fresh one."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _map_in_pool(fn: Callable, *iterables) -> list:
+    """
+    Run fn over iterables in the shared process pool and return the results in order.
+    
+    If the pool is broken (e.g. a worker died), it is replaced and the call retried
+    once. If that fails too, ValueError is raised rather than running the work
+    in-process, where whatever crashed the worker could take down the server.
+    """
+    for _ in range(2):
+        pool = _get_process_pool()
+        try:
+            return list(pool.map(fn, *iterables))
+        except BrokenProcessPool as e:
+            logger.warning(f"Process pool broken, recreating it: {str(e)}")
+            _discard_process_pool(pool)
+    raise ValueError("page worker crashed")
+
+
+def _get_ocr_pool() -> ThreadPoolExecutor:
+    """Get or create the shared thread pool for OCR."""
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is None:
+            # tesseract runs as a subprocess and pytesseract waits on it with the GIL
+            # released, so threads parallelize OCR without pickling page images
+            _ocr_pool = ThreadPoolExecutor(max_workers=_page_worker_count(), thread_name_prefix="ocr")
+        return _ocr_pool
+
+
+def shutdown_pool():
+    """Shut down the shared process and OCR thread pools, if they were created."""
+    global _process_pool, _ocr_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+    with _ocr_pool_lock:
+        ocr_pool, _ocr_pool = _ocr_pool, None
+    if ocr_pool is not None:
+        ocr_pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _extract_pages_tables(pdf_content: bytes, page_indices: Sequence[int]) -> List[str]:
+    """Process-pool worker: extract a batch of pages with PDFExtractor._extract_page_with_tables."""
+    with pdfplumber.open(io.BytesIO(pdf_content), pages=[idx + 1 for idx in page_indices]) as pdf:
+        return [PDFExtractor._extract_page_with_tables(page) for page in pdf.pages]
+
+
+def _has_column_gap(rects: Sequence[Tuple[float, float, float, float]]) -> bool:
+    """
+    Check whether text runs (left, bottom, right, top) are split into side-by-side columns.
+    
+    True if some vertical band at least PROBE_MIN_COLUMN_GAP wide is crossed by no
+    run and has at least PROBE_MIN_COLUMN_RUNS runs entirely on each side of it.
+    """
+    if not rects:
+        return False
+    boxes = np.array(rects, dtype=float)
+    lefts, rights = boxes[:, 0], boxes[:, 2]
+    origin = int(lefts.min())
+    covered = np.zeros(int(np.ceil(rights.max())) - origin, dtype=bool)
+    for left, right in zip(lefts.astype(int) - origin, np.ceil(rights).astype(int) - origin):
+        covered[left:right] = True
+    # Boundaries of the uncovered bands: starts where coverage ends, ends where it resumes
+    edges = np.flatnonzero(np.diff(covered.astype(np.int8)))
+    for gap_start, gap_end in zip(edges[::2] + 1 + origin, edges[1::2] + 1 + origin):
+        if gap_end - gap_start < PROBE_MIN_COLUMN_GAP:
+            continue
+        if (np.count_nonzero(rights <= gap_start) >= PROBE_MIN_COLUMN_RUNS
+                and np.count_nonzero(lefts >= gap_end) >= PROBE_MIN_COLUMN_RUNS):
+            return True
+    return False
+
+
+def _has_aligned_numbers(rects: Sequence[Tuple[float, float, float, float]], run_texts: Sequence[str]) -> bool:
+    """
+    Check whether numeric text runs line up vertically, as in a table column or a
+    right-hand column of dates: at least PROBE_MIN_COLUMN_RUNS runs with no letters
+    sharing a left or right edge (to the nearest point).
+    """
+    edge_counts = {}
+    for (left, _, right, _), run_text in zip(rects, run_texts):
+        if _NUMERIC_CELL_RE.fullmatch(run_text.strip()):
+            for edge in (('left', round(left)), ('right', round(right))):
+                edge_counts[edge] = edge_counts.get(edge, 0) + 1
+                if edge_counts[edge] >= PROBE_MIN_COLUMN_RUNS:
+                    return True
+    return False
+
+
+def _ocr_zoom(page) -> float:
+    """
+    Pick the render zoom for OCR of a PyMuPDF page.
+    
+    A full-page scan (an image covering at least OCR_SCAN_MIN_COVERAGE of the page)
+    is rendered at its native resolution, clamped to [OCR_ZOOM, OCR_MAX_ZOOM], so
+    low-resolution scans never drop below the previous 2x. Any other page uses OCR_ZOOM.
+    """
+    page_area = page.rect.width * page.rect.height
+    native_dpi = 0.0
+    for image in page.get_images(full=True):
+        xref, width_px = image[0], image[2]
+        for rect in page.get_image_rects(xref):
+            visible = rect & page.rect
+            if rect.width > 0 and visible.width * visible.height >= OCR_SCAN_MIN_COVERAGE * page_area:
+                native_dpi = max(native_dpi, width_px * 72.0 / rect.width)
+    if not native_dpi:
+        return OCR_ZOOM
+    return max(OCR_ZOOM, min(OCR_MAX_ZOOM, native_dpi / 72.0))
+
+
+def _ocr_page(rendered_page: Tuple[bytes, int, int]) -> str:
+    """OCR thread worker: OCR one rendered page given as (grayscale samples, width, height)."""
+    import pytesseract  # type: ignore
+    from PIL import Image  # type: ignore
+    
+    samples, width, height = rendered_page
+    img = Image.frombytes("L", (width, height), samples)
+    return pytesseract.image_to_string(img)
+
 
 class PDFExtractor:
     """Service for extracting text from PDF files with multiple fallback methods."""
     
     @staticmethod
     def extract_text(pdf_content: bytes) -> str:
+        """
+        Extract text from PDF content, reusing the result for previously seen PDFs.
+        
+        Args:
+            pdf_content: PDF file content as bytes
+            
+        Returns:
+            Extracted text as string (normalized and cleaned)
+            
+        Raises:
+            ValueError: If PDF cannot be processed
+        """
+        key = hashlib.blake2b(pdf_content, digest_size=16).digest()
+        with _extraction_cache_lock:
+            cached = _extraction_cache.get(key)
+            if cached is not None:
+                _extraction_cache.move_to_end(key)
+                logger.debug("Returning cached extraction result")
+                return cached
+        
+        text = PDFExtractor._extract_uncached(pdf_content)
+        
+        with _extraction_cache_lock:
+            _extraction_cache[key] = text
+            if len(_extraction_cache) > EXTRACTION_CACHE_SIZE:
+                _extraction_cache.popitem(last=False)
+        return text
+    
+    @staticmethod
+    def _extract_uncached(pdf_content: bytes) -> str:
         """
         Extract text from PDF content using multiple extraction methods.
         
@@ -22,7 +316,10 @@ class PDFExtractor:
         1. pdfplumber with table extraction (best for structured data)
         2. pdfplumber standard extraction
         3. pypdfium2 (if available)
-        4. PyPDF2 (fallback)
+        4. PyPDF2 (fallback, only when pypdfium2 is not installed)
+        
+        Plain text PDFs (dense first page, no table hints) try pypdfium2 first,
+        since it is much faster and pdfplumber's layout handling adds nothing.
         
         Args:
             pdf_content: PDF file content as bytes
@@ -33,25 +330,45 @@ class PDFExtractor:
         Raises:
             ValueError: If PDF cannot be processed
         """
-        extraction_methods = [
+        # pdfplumber methods take the open pdfplumber document plus the raw bytes
+        # (the table-aware one hands the bytes to its page workers)
+        pdfplumber_methods = [
             PDFExtractor._extract_with_pdfplumber_tables,
             PDFExtractor._extract_with_pdfplumber,
-            PDFExtractor._extract_with_pypdfium2,
-            PDFExtractor._extract_with_pypdf2,
         ]
+        # The remaining methods take the raw bytes
+        bytes_methods = [
+            PDFExtractor._extract_with_pypdfium2 if pdfium is not None else PDFExtractor._extract_with_pypdf2,
+        ]
+        
+        text_chars, has_table_hints = PDFExtractor._probe_text_density(pdf_content)
+        if text_chars > FAST_PATH_MIN_CHARS and not has_table_hints:
+            method_groups = [bytes_methods, pdfplumber_methods]
+        else:
+            method_groups = [pdfplumber_methods, bytes_methods]
         
         last_error = None
-        for method in extraction_methods:
-            try:
-                text = method(pdf_content)
-                if text and len(text.strip()) > 50:  # Minimum viable text
-                    normalized_text = PDFExtractor._normalize_text(text)
-                    logger.info(f"Successfully extracted text using {method.__name__}, length: {len(normalized_text)}")
-                    return normalized_text
-            except Exception as e:
-                last_error = e
-                logger.debug(f"Extraction method {method.__name__} failed: {str(e)}")
-                continue
+        with ExitStack() as stack:
+            # Both pdfplumber methods share one parsed document (opened on first use),
+            # so falling back from one to the other does not re-parse the PDF
+            plumber_pdf = None
+            for methods in method_groups:
+                for method in methods:
+                    try:
+                        if methods is pdfplumber_methods:
+                            if plumber_pdf is None:
+                                plumber_pdf = stack.enter_context(pdfplumber.open(io.BytesIO(pdf_content)))
+                            text = method(plumber_pdf, pdf_content)
+                        else:
+                            text = method(pdf_content)
+                        if text and len(text.strip()) > 50:  # Minimum viable text
+                            normalized_text = PDFExtractor._normalize_text(text)
+                            logger.info(f"Successfully extracted text using {method.__name__}, length: {len(normalized_text)}")
+                            return normalized_text
+                    except Exception as e:
+                        last_error = e
+                        logger.debug(f"Extraction method {method.__name__} failed: {str(e)}")
+                        continue
         
         # If all methods failed, try OCR as last resort (optional)
         try:
@@ -69,76 +386,137 @@ class PDFExtractor:
         raise ValueError(error_msg)
     
     @staticmethod
-    def _extract_with_pdfplumber_tables(pdf_content: bytes) -> str:
-        """Extract text using pdfplumber with special attention to tables and layout (better for Canva PDFs)."""
-        pages_text = []
-        with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
-            for page_num, page in enumerate(pdf.pages):
-                # Try layout-based extraction first (better for Canva PDFs with separate text boxes)
-                # This preserves spatial relationships and ordering
+    def _probe_text_density(pdf_content: bytes) -> Tuple[int, bool]:
+        """
+        Cheaply inspect the first page with pypdfium2.
+        
+        The page counts as having table hints if its text contains tabs or wide
+        spacing, if its text runs form side-by-side columns (_has_column_gap), or if
+        numeric runs line up vertically (_has_aligned_numbers).
+        
+        Returns:
+            Tuple of (first-page text length, whether the page hints at tables).
+            Returns (0, True) if the probe cannot run, keeping the default order.
+        """
+        if pdfium is None:
+            return 0, True
+        
+        try:
+            pdf = pdfium.PdfDocument(pdf_content)
+            try:
+                if len(pdf) == 0:
+                    return 0, True
+                page = pdf.get_page(0)
+                textpage = page.get_textpage()
                 try:
-                    # Extract words with their positions to maintain order
-                    words = page.extract_words(keep_blank_chars=False, x_tolerance=3, y_tolerance=3)
-                    if words:
-                        # Sort by y position (top to bottom), then x position (left to right)
-                        words_sorted = sorted(words, key=lambda w: (round(w['top'], 1), w['x0']))
-                        # Reconstruct text maintaining order
-                        page_text = ""
-                        prev_y = None
-                        for word in words_sorted:
-                            current_y = round(word['top'], 1)
-                            # Add newline if we moved to a new line
-                            if prev_y is not None and abs(current_y - prev_y) > 5:
-                                page_text += "\n"
-                            page_text += word['text'] + " "
-                            prev_y = current_y
-                        if page_text.strip():
-                            pages_text.append(page_text.strip())
-                            continue
-                except Exception:
-                    pass
-                
-                # Fallback to standard text extraction
-                page_text = page.extract_text() or ""
-                
-                # Extract text from tables (important for experience dates)
-                tables = page.extract_tables()
-                if tables:
-                    table_texts = []
-                    for table in tables:
-                        if table:
-                            # Convert table to readable text format
-                            for row in table:
-                                if row:
-                                    # Filter out None values and join with spaces
-                                    row_text = " | ".join(str(cell) if cell else "" for cell in row if cell)
-                                    if row_text.strip():
-                                        table_texts.append(row_text)
-                    if table_texts:
-                        page_text += "\n" + "\n".join(table_texts)
-                
-                if page_text.strip():
-                    pages_text.append(page_text)
+                    text = textpage.get_text_range()
+                    rects = [textpage.get_rect(i) for i in range(textpage.count_rects())]
+                    run_texts = [textpage.get_text_bounded(*rect) for rect in rects]
+                finally:
+                    textpage.close()
+                    page.close()
+            finally:
+                pdf.close()
+        except Exception as e:
+            logger.debug(f"Text density probe failed: {str(e)}")
+            return 0, True
         
-        return "\n\n".join(pages_text)
+        has_table_hints = (
+            _TABLE_HINT_RE.search(text) is not None
+            or _has_column_gap(rects)
+            or _has_aligned_numbers(rects, run_texts)
+        )
+        return len(text.strip()), has_table_hints
     
     @staticmethod
-    def _extract_with_pdfplumber(pdf_content: bytes) -> str:
-        """Extract text using pdfplumber standard method."""
-        pages_text = []
-        with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
+    def _extract_with_pdfplumber_tables(pdf, pdf_content: bytes) -> str:
+        """
+        Extract text from an open pdfplumber document with special attention to tables
+        and layout (better for Canva PDFs).
+        
+        Multi-page documents are processed in worker processes, which reopen the raw
+        pdf_content since parsed pdfplumber objects cannot be pickled.
+        """
+        page_count = len(pdf.pages)
+        if page_count <= 1 or _page_worker_count() <= 1:
+            # A single page (or a single CPU) is not worth the inter-process overhead
+            pages_text = [PDFExtractor._extract_page_with_tables(page) for page in pdf.pages]
+            return "\n\n".join(text for text in pages_text if text)
+        
+        # Pages are CPU-bound and independent, so spread them across processes.
+        # Each worker gets one contiguous batch of page indices, so the PDF bytes are
+        # pickled (and reopened) once per worker rather than once per page.
+        workers = min(_page_worker_count(), page_count)
+        batches = [
+            range(i * page_count // workers, (i + 1) * page_count // workers)
+            for i in range(workers)
+        ]
+        batch_texts = _map_in_pool(_extract_pages_tables, [pdf_content] * workers, batches)
+        return "\n\n".join(text for texts in batch_texts for text in texts if text)
+    
+    @staticmethod
+    def _extract_page_with_tables(page) -> str:
+        """Extract text from a single pdfplumber page, preserving layout and table content."""
+        # Try layout-based extraction first (better for Canva PDFs with separate text boxes)
+        # This preserves spatial relationships and ordering
+        try:
+            # Extract words with their positions to maintain order
+            words = page.extract_words(keep_blank_chars=False, x_tolerance=3, y_tolerance=3)
+            if words:
+                # Sort by y position (top to bottom), then x position (left to right).
+                # Keys are held in arrays so the sort runs in numpy, not via a Python lambda.
+                # y positions are bucketed to integer tenths of a unit instead of round(top, 1).
+                tops = np.fromiter((w['top'] for w in words), dtype=np.float64, count=len(words))
+                x0s = np.fromiter((w['x0'] for w in words), dtype=np.float64, count=len(words))
+                y_buckets = (tops * 10).astype(np.int64)
+                order = np.lexsort((x0s, y_buckets))
+                # Add newline wherever we moved to a new line (more than 5 units, i.e. 50 buckets)
+                newlines = np.abs(np.diff(y_buckets[order])) > 50
+                # Reconstruct text maintaining order: split the sorted words into lines
+                # at the newline positions and let str.join assemble each line
+                texts = [words[word_idx]['text'] for word_idx in order]
+                breaks = [0, *(np.flatnonzero(newlines) + 1).tolist(), len(texts)]
+                page_text = " \n".join(
+                    " ".join(texts[start:end]) for start, end in zip(breaks, breaks[1:])
+                ).strip()
                 if page_text:
-                    pages_text.append(page_text)
+                    return page_text
+        except Exception:
+            pass
+        
+        # Fallback to standard text extraction
+        page_text = page.extract_text() or ""
+        
+        # Extract text from tables (important for experience dates)
+        tables = page.extract_tables()
+        if tables:
+            # Convert tables to readable text format, one row per line,
+            # skipping empty cells and rows with no visible text
+            table_text = "\n".join(
+                row_text
+                for table in tables if table
+                for row in table if row
+                if (row_text := " | ".join(map(str, filter(None, row)))).strip()
+            )
+            if table_text:
+                page_text += "\n" + table_text
+        
+        return page_text if page_text.strip() else ""
+    
+    @staticmethod
+    def _extract_with_pdfplumber(pdf, pdf_content: bytes) -> str:
+        """Extract text from an open pdfplumber document using the standard method."""
+        pages_text = []
+        for page in pdf.pages:
+            page_text = page.extract_text()
+            if page_text:
+                pages_text.append(page_text)
         return "\n\n".join(pages_text)
     
     @staticmethod
     def _extract_with_pypdfium2(pdf_content: bytes) -> str:
         """Extract text using pypdfium2 (if available)."""
-        try:
-            import pypdfium2 as pdfium
-        except ImportError:
+        if pdfium is None:
             raise ValueError("pypdfium2 not available")
         
         pages_text = []
@@ -147,9 +525,17 @@ class PDFExtractor:
             for page_num in range(len(pdf)):
                 page = pdf.get_page(page_num)
                 textpage = page.get_textpage()
-                page_text = textpage.get_text_range()
-                if page_text:
-                    pages_text.append(page_text)
+                try:
+                    # Skip pages without text instead of extracting an empty range
+                    char_count = textpage.count_chars()
+                    if char_count > 0:
+                        page_text = textpage.get_text_range(0, char_count)
+                        if page_text:
+                            pages_text.append(page_text)
+                finally:
+                    # Release PDFium page handles as we go rather than at document close
+                    textpage.close()
+                    page.close()
         finally:
             pdf.close()
         
@@ -158,6 +544,8 @@ class PDFExtractor:
     @staticmethod
     def _extract_with_pypdf2(pdf_content: bytes) -> str:
         """Extract text using PyPDF2 (fallback method)."""
+        import PyPDF2  # Imported here; only needed when pypdfium2 is unavailable
+        
         pages_text = []
         pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_content))
         for page in pdf_reader.pages:
@@ -172,31 +560,46 @@ class PDFExtractor:
         Extract text using OCR (Tesseract) for scanned PDFs.
         This is optional and requires pytesseract and tesseract-ocr to be installed.
         """
+        # pytesseract and Pillow are only imported by the OCR workers (_ocr_page);
+        # here we just check that they are installed
         try:
-            import pytesseract  # type: ignore
-            from PIL import Image  # type: ignore
             import fitz  # type: ignore # PyMuPDF
+            ocr_available = all(importlib.util.find_spec(name) is not None for name in ("pytesseract", "PIL"))
         except ImportError:
+            ocr_available = False
+        if not ocr_available:
             raise ValueError("OCR dependencies not available (pytesseract, Pillow, PyMuPDF)")
         
-        # Convert PDF pages to images and OCR them
+        # Pages are OCR'd concurrently, so keep each tesseract process single-threaded
+        # instead of letting every one of them spawn an OpenMP thread per core.
+        # pytesseract starts tesseract with the process environment.
+        os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+        
+        # Render PDF pages to raw pixel buffers (fast), then OCR them (slow, CPU-bound).
+        # Pages are handled in bounded batches so only a few pixmaps are held at once.
+        batch_size = _page_worker_count() * OCR_BATCH_PAGES_PER_WORKER
         pages_text = []
         pdf_document = fitz.open(stream=pdf_content, filetype="pdf")
         
         try:
-            for page_num in range(len(pdf_document)):
-                page = pdf_document[page_num]
-                # Render page to image
-                pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))  # 2x zoom for better OCR
-                img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                # OCR the image
-                page_text = pytesseract.image_to_string(img)
-                if page_text.strip():
-                    pages_text.append(page_text)
+            for batch_start in range(0, len(pdf_document), batch_size):
+                rendered_pages = []
+                for page_num in range(batch_start, min(batch_start + batch_size, len(pdf_document))):
+                    page = pdf_document[page_num]
+                    # Render page to a grayscale image (tesseract works on grayscale anyway)
+                    zoom = _ocr_zoom(page)
+                    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csGRAY)
+                    rendered_pages.append((pix.samples, pix.width, pix.height))
+                
+                if len(rendered_pages) > 1 and _page_worker_count() > 1:
+                    # OCR pages in parallel, one tesseract subprocess per thread
+                    pages_text.extend(_get_ocr_pool().map(_ocr_page, rendered_pages))
+                else:
+                    pages_text.extend(map(_ocr_page, rendered_pages))
         finally:
             pdf_document.close()
         
-        return "\n\n".join(pages_text)
+        return "\n\n".join(text for text in pages_text if text.strip())
     
     @staticmethod
     def _normalize_text(text: str) -> str:
@@ -211,67 +614,45 @@ class PDFExtractor:
         if not text:
             return ""
         
+        # pypdfium2 (and some PDFs) use CRLF/CR line breaks; normalize them to "\n"
+        # so the text has the same shape whichever extractor produced it
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        
+        # Passes below are skipped when a cheap check shows they cannot match,
+        # so already-clean text (e.g. from pypdfium2) takes far fewer full scans
+        
         # Fix common date format issues FIRST (before normalizing whitespace)
-        # Fix dates with spaces in the middle: "201 9" -> "2019", "20 15" -> "2015"
-        # Pattern: 4 digits with space(s) in between
-        text = re.sub(r'(\d{1,2})\s+(\d{2,4})', r'\1\2', text)
-        # Fix "20 1 5" -> "2015", "20 1 0" -> "2010", etc. (3+ digit groups)
-        text = re.sub(r'(\d{2})\s+(\d{1,2})\s+(\d{1,2})', r'\1\2\3', text)
-        # Fix dates in format like "06/201 9" -> "06/2019" or "04/202 3" -> "04/2023"
-        text = re.sub(r'(\d{1,2}/)(\d{1,3})\s+(\d{1,2})', r'\1\2\3', text)
-        # Fix dates like "201 9" -> "2019" or "20 19" -> "2019" (year with space in middle)
-        # This handles cases where a 4-digit year is split: "201 9", "20 19", "2 019", etc.
-        def fix_year_space(match):
-            parts = match.group(0).split()
-            combined = ''.join(parts)
-            # If it looks like a year (3-4 digits), combine them
-            if len(combined) >= 3 and len(combined) <= 4 and all(c.isdigit() for c in combined):
-                return combined
-            return match.group(0)
-        text = re.sub(r'\d{2,4}\s+\d{1,2}(?!\s*\d)', fix_year_space, text)
+        # Join years split by spaces in a single pass: "201 9" -> "2019", "20 15" -> "2015",
+        # "20 1 5" -> "2015", "06/201 9" -> "06/2019", "04/202 3" -> "04/2023"
+        if _DIGIT_SPACE_DIGIT_RE.search(text):
+            text = _SPLIT_DIGITS_RE.sub(_collapse_split_digits, text)
         
         # Normalize whitespace (multiple spaces/newlines to single space, but preserve line breaks for structure)
         # First, normalize multiple spaces to single space
-        text = re.sub(r' +', ' ', text)
+        if "  " in text:
+            text = _MULTI_SPACE_RE.sub(' ', text)
         # Then normalize multiple newlines to double newline (paragraph break)
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        # Fix "Jan uary" -> "January", "Feb ruary" -> "February", etc.
-        month_fixes = {
-            r'Jan\s+uary': 'January',
-            r'Feb\s+ruary': 'February',
-            r'Mar\s+ch': 'March',
-            r'Apr\s+il': 'April',
-            r'May\s+': 'May',
-            r'Jun\s+e': 'June',
-            r'Jul\s+y': 'July',
-            r'Aug\s+ust': 'August',
-            r'Sep\s+tember': 'September',
-            r'Oct\s+ober': 'October',
-            r'Nov\s+ember': 'November',
-            r'Dec\s+ember': 'December',
-        }
-        for pattern, replacement in month_fixes.items():
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-        
-        # Fix common OCR mistakes in dates
-        # "O" -> "0" in dates (e.g., "2O15" -> "2015")
-        text = re.sub(r'(\d)O(\d)', r'\g<1>0\g<2>', text)
-        # "l" -> "1" in dates (e.g., "2Ol5" -> "2015")
-        text = re.sub(r'(\d)l(\d)', r'\g<1>1\g<2>', text)
+        if "\n\n\n" in text:
+            text = _MULTI_NEWLINE_RE.sub('\n\n', text)
+        # Fix "Jan uary" -> "January", "Feb ruary" -> "February", etc. in a single pass
+        text = _MONTH_SPLIT_RE.sub(_fix_month, text)
+        
+        # Fix common OCR mistakes in dates in one pass
+        # "O" -> "0", "l"/"I" -> "1" between digits (e.g., "2O15" -> "2015", "20l5" -> "2015")
+        text = _OCR_DIGIT_FIX_RE.sub(_fix_ocr_digit, text)
         
         # Normalize date separators
-        text = re.sub(r'(\d{1,2})[/\-\.](\d{1,2})[/\-\.](\d{2,4})', r'\1/\2/\3', text)
+        text = _DATE_SEP_RE.sub(r'\1/\2/\3', text)
         
-        # Fix "Present" variations
-        present_variations = ['Present', 'present', 'PRESENT', 'Current', 'current', 'CURRENT', 
-                             'Now', 'now', 'NOW', 'Till date', 'till date', 'TILL DATE']
-        for variant in present_variations:
-            text = re.sub(rf'\b{variant}\b', 'Present', text, flags=re.IGNORECASE)
+        # Fix "Present" variations (Current, Now, Till date, any case)
+        text = _PRESENT_RE.sub('Present', text)
         
         # Final cleanup: ensure dates are properly formatted
         # Fix dates like "04/2023" that might have been corrupted
         # Ensure year is 4 digits when possible
-        text = re.sub(r'(\d{1,2}/)(\d{2})(?!\d)', lambda m: m.group(1) + ('20' + m.group(2) if int(m.group(2)) < 50 else '19' + m.group(2)), text)
+        if "/" in text:
+            text = _TWO_DIGIT_YEAR_RE.sub(_expand_two_digit_year, text)
         
         # Trim and return
         return text.strip()